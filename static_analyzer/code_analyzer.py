@@ -8,6 +8,8 @@ import argparse
 import os
 import re
 import ast
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 regex_construction_spaces = re.compile(r'^(def|class)\s{2,}')
 regex_camel_case = re.compile(r'^[A-Z][a-zA-Z0-9]+$')
@@ -18,23 +20,32 @@ def main():
     """
     Main function that orchestrates reading the folder, retrieving files, and running checks.
     """
-    path = read_folder()
+    path, prefetch = read_folder()
     files = get_sorted_files(path)
-    for file in files:
-        run_check_on_file(file)
+    if prefetch > 0:
+        for file, content in prefetch_files(files, prefetch):
+            run_checks(file, content)
+    else:
+        for file in files:
+            run_check_on_file(file)
 
 
 def read_folder():
     """
-    Parses command-line arguments to retrieve the folder or file path.
+    Parses command-line arguments to retrieve the folder or file path and the prefetch depth.
 
     Returns:
-        str: Path to the folder or file provided by the user.
+        tuple: Path to the folder or file provided by the user and the number of reader threads
+        (0 means files are read sequentially).
     """
     parser = argparse.ArgumentParser(usage="Static Code Analyzer")
     parser.add_argument('folder', type=str, help="takes a single file or folder path")
+    parser.add_argument('--prefetch', type=int, default=0,
+                        help="number of threads reading upcoming files ahead of the checks (0 - disabled)")
     args = parser.parse_args()
-    return args.folder
+    if args.prefetch < 0:
+        parser.error('--prefetch must be a non-negative number')
+    return args.folder, args.prefetch
 
 
 def get_sorted_files(path):
@@ -63,6 +74,49 @@ def get_sorted_files(path):
     return files
 
 
+def read_file(file_path):
+    """
+    Read and decode a single Python file.
+
+    Args:
+        file_path (str): Path to the Python file.
+
+    Returns:
+        str: Content of the file.
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        return file.read()
+
+
+def prefetch_files(files, workers):
+    """
+    Read files ahead of the caller with a thread pool, keeping the original order.
+
+    At most 2 * workers files are read in advance, so memory stays bounded while
+    disk I/O overlaps with the checks performed by the caller.
+
+    Args:
+        files (list): Sorted list of file paths.
+        workers (int): Number of reader threads.
+
+    Yields:
+        tuple: File path and its content, in the order of the input list.
+    """
+    files_iter = iter(files)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for file_path in files_iter:
+            pending.append((file_path, executor.submit(read_file, file_path)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            file_path, future = pending.popleft()
+            next_file = next(files_iter, None)
+            if next_file is not None:
+                pending.append((next_file, executor.submit(read_file, next_file)))
+            yield file_path, future.result()
+
+
 def run_check_on_file(file_path):
     """
     Process a single file and perform all style and structural checks.
@@ -70,23 +124,32 @@ def run_check_on_file(file_path):
     Args:
         file_path (str): Path to the Python file to be checked.
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-        tree = ast.parse(content)
-        lines = content.splitlines()
-        blank_line = 0
-
-        for i, line in enumerate(lines, start=1):
-            run_line_checks(file_path, line, i)
-
-            if not line.strip():
-                blank_line += 1
-            else:
-                if blank_line > 2:
-                    print(f'{file_path}: Line {i}: S006 More than two blank lines used before this line')
-                blank_line = 0
-
-        run_ast_checks(tree, file_path)
+    run_checks(file_path, read_file(file_path))
+
+
+def run_checks(file_path, content):
+    """
+    Perform all style and structural checks on the content of a file.
+
+    Args:
+        file_path (str): Path to the file the content was read from.
+        content (str): Source code of the file.
+    """
+    tree = ast.parse(content)
+    lines = content.splitlines()
+    blank_line = 0
+
+    for i, line in enumerate(lines, start=1):
+        run_line_checks(file_path, line, i)
+
+        if not line.strip():
+            blank_line += 1
+        else:
+            if blank_line > 2:
+                print(f'{file_path}: Line {i}: S006 More than two blank lines used before this line')
+            blank_line = 0
+
+    run_ast_checks(tree, file_path)
 
 
 def run_line_checks(file_path, line, i):